@@ -1,13 +1,55 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+import numpy as np
 from typing import Dict, List, Tuple, Optional
-import json
+import orjson
 from datetime import datetime, timedelta
 import time
 import pickle
+import gzip
+import heapq
 import os
-from fuzzywuzzy import fuzz
-from fuzzywuzzy import process
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from operator import itemgetter
+from rapidfuzz import fuzz, process, utils
+
+# Columns of the FPL 'elements' payload that the recommender actually uses
+NEEDED_COLS = [
+    'id', 'first_name', 'second_name', 'web_name', 'element_type', 'team',
+    'now_cost', 'form', 'selected_by_percent', 'ict_index', 'total_points', 'status'
+]
+
+# Columns carried into the squad/candidate frames that get scored and displayed
+SCORING_COLS = [
+    'id', 'full_name', 'team', 'team_name', 'position_name', 'now_cost', 'value', 'status',
+    'form_numeric', 'total_points', 'ict_index_numeric', 'selected_by_percent_numeric',
+    'pos_mult', 'premium_bonus'
+]
+
+# Player score weights for [form, fixture, historical, points, ict, web]
+W_WITH_WEB = np.array([0.25, 0.20, 0.15, 0.12, 0.08, 0.20], dtype=np.float32)
+# Without web data, redistribute weights
+W_NO_WEB = np.array([0.30, 0.25, 0.20, 0.15, 0.10, 0.0], dtype=np.float32)
+
+# Captain score weights for [fixture, form, historical, web]
+W_CAPTAIN = np.array([0.40, 0.25, 0.20, 0.15])
+
+# Captaincy position multipliers (forwards and mids more likely to return), gathered by position code
+POSITION_CODES = {'GK': 0, 'DEF': 1, 'MID': 2, 'FWD': 3}
+POSITION_MULT = np.array([0.5, 0.9, 1.1, 1.2])
+
+# Squad columns returned by suggest_captain, mapped to their output keys
+CAPTAIN_OUT_COLS = {
+    'full_name': 'player_name', 'id': 'player_id', 'team_name': 'team', 'position_name': 'position',
+    'value': 'price', 'captain_score': 'captain_score', 'form_numeric': 'form',
+    'opponent_name': 'opponent', 'is_home': 'is_home', 'fixture_difficulty': 'fixture_difficulty',
+    'expected_points': 'expected_points', 'is_web_captain': 'is_web_captain',
+    'total_points': 'total_points', 'selected_by_percent_numeric': 'selected_by'
+}
 
 class FPLRecommender:
     """
@@ -31,16 +73,43 @@ class FPLRecommender:
         self.current_gameweek = None
         self.use_web_data = use_web_data
         self.web_aggregator = None
+        self._web_snapshot: Dict[str, Dict] = {}
         self.cache_duration_hours = cache_duration_hours
         self.cache_dir = '.fpl_cache'
         
+        # Shared keep-alive session (sized for the concurrent summary prefetch)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        self._name_choices = None
+        self._web_choices = None
+        self._team_name_map = None
+        self._full_lower_idx: Dict[str, int] = {}
+        self._web_lower_idx: Dict[str, int] = {}
+        self._team_next_opponent: Dict[int, int] = {}
+        self._opponent_names: Dict[int, str] = {}
+        self._is_home: Dict[int, bool] = {}
+        self._team_upcoming_difficulty: Dict[int, List[int]] = {}
+        self._team_upcoming_fixtures: Dict[int, List[Dict]] = {}
+        self._team_fdr5: Dict[int, float] = {}
+        self._element_summary_cache: Dict[int, Dict] = {}
+        self._element_summary_fetched: Dict[int, float] = {}
+        self._use_cache = False
+        self._history_memo: Dict[Tuple[int, int], Dict] = {}
+        
         # Create cache directory
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
     
-    def _get_cache_path(self, cache_type: str) -> str:
+    def _get_cache_path(self, cache_type: str, ext: str = 'pkl') -> str:
         """Get cache file path"""
-        return os.path.join(self.cache_dir, f'{cache_type}_{self.team_id}.pkl')
+        return os.path.join(self.cache_dir, f'{cache_type}_{self.team_id}.{ext}')
     
     def _is_cache_valid(self, cache_path: str) -> bool:
         """Check if cache file exists and is still valid"""
@@ -56,11 +125,14 @@ class FPLRecommender:
         """Save data to cache"""
         cache_path = self._get_cache_path(cache_type)
         try:
-            with open(cache_path, 'wb') as f:
-                pickle.dump(data, f)
+            with gzip.open(cache_path, 'wb', compresslevel=1) as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
             print(f"  ✓ Cached {cache_type}")
         except Exception as e:
             print(f"  ✗ Cache save failed for {cache_type}: {e}")
+            # A partial file would look fresh to _is_cache_valid on the next run
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
     
     def _load_cache(self, cache_type: str) -> Optional[any]:
         """Load data from cache"""
@@ -70,7 +142,7 @@ class FPLRecommender:
             return None
         
         try:
-            with open(cache_path, 'rb') as f:
+            with gzip.open(cache_path, 'rb') as f:
                 data = pickle.load(f)
             print(f"  ✓ Loaded {cache_type} from cache")
             return data
@@ -78,10 +150,36 @@ class FPLRecommender:
             print(f"  ✗ Cache load failed for {cache_type}: {e}")
             return None
     
+    def _save_json_cache(self, cache_type: str, data: any):
+        """Save JSON-shaped data to cache"""
+        cache_path = self._get_cache_path(cache_type, 'json')
+        try:
+            with open(cache_path, 'wb') as f:
+                f.write(orjson.dumps(data))
+            print(f"  ✓ Cached {cache_type}")
+        except Exception as e:
+            print(f"  ✗ Cache save failed for {cache_type}: {e}")
+    
+    def _load_json_cache(self, cache_type: str) -> Optional[any]:
+        """Load JSON-shaped data from cache"""
+        cache_path = self._get_cache_path(cache_type, 'json')
+        
+        if not self._is_cache_valid(cache_path):
+            return None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                data = orjson.loads(f.read())
+            print(f"  ✓ Loaded {cache_type} from cache")
+            return data
+        except Exception as e:
+            print(f"  ✗ Cache load failed for {cache_type}: {e}")
+            return None
+    
     def clear_cache(self):
         """Clear all cached data"""
         import glob
-        cache_files = glob.glob(os.path.join(self.cache_dir, '*.pkl'))
+        cache_files = glob.glob(os.path.join(self.cache_dir, '*'))
         for file in cache_files:
             try:
                 os.remove(file)
@@ -92,21 +190,30 @@ class FPLRecommender:
     
     def fetch_fpl_data(self, use_cache: bool = True) -> Dict:
         """Fetch current season data from FPL API with caching"""
+        self._use_cache = use_cache
         if use_cache:
-            cached_data = self._load_cache('fpl_data')
+            self._load_element_summaries()
+            self._history_memo.clear()
+            
+            # Player rows live in the players_df Parquet cache, so the JSON
+            # blob (events, teams, fixtures) is only usable alongside it
+            cached_data = None
+            if self._is_cache_valid(self._get_cache_path('players_df', 'parquet')):
+                cached_data = self._load_json_cache('fpl_data')
             if cached_data:
                 self.data = cached_data
                 self.current_gameweek = next(
                     (gw['id'] for gw in self.data['events'] if gw['is_current']), 
                     next((gw['id'] for gw in self.data['events'] if gw['is_next']), 1)
                 )
+                self._build_fixture_tables()
                 return self.data
         
         try:
             print("  Fetching fresh FPL data from API...")
-            response = requests.get(f"{self.base_url}bootstrap-static/")
+            response = self._session.get(f"{self.base_url}bootstrap-static/", timeout=10)
             response.raise_for_status()
-            self.data = response.json()
+            self.data = orjson.loads(response.content)
             
             self.current_gameweek = next(
                 (gw['id'] for gw in self.data['events'] if gw['is_current']),
@@ -120,15 +227,18 @@ class FPLRecommender:
             
             # Fetch fixtures separately
             print("  Fetching fixtures data...")
-            fixtures_response = requests.get(f"{self.base_url}fixtures/")
+            fixtures_response = self._session.get(f"{self.base_url}fixtures/", timeout=10)
             fixtures_response.raise_for_status()
-            self.data['fixtures'] = fixtures_response.json()
+            self.data['fixtures'] = orjson.loads(fixtures_response.content)
+            self._build_fixture_tables()
             
             if use_cache:
-                self._save_cache('fpl_data', self.data)
+                self._save_json_cache(
+                    'fpl_data', {k: v for k, v in self.data.items() if k != 'elements'}
+                )
             
             return self.data
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching FPL data: {e}")
             return None
     
@@ -144,15 +254,16 @@ class FPLRecommender:
         
         try:
             print("  Fetching fresh team data from API...")
-            response = requests.get(f"{self.base_url}entry/{self.team_id}/")
+            response = self._session.get(f"{self.base_url}entry/{self.team_id}/", timeout=10)
             response.raise_for_status()
-            team_data = response.json()
+            team_data = orjson.loads(response.content)
             
-            picks_response = requests.get(
-                f"{self.base_url}entry/{self.team_id}/event/{self.current_gameweek}/picks/"
+            picks_response = self._session.get(
+                f"{self.base_url}entry/{self.team_id}/event/{self.current_gameweek}/picks/",
+                timeout=10
             )
             picks_response.raise_for_status()
-            picks_data = picks_response.json()
+            picks_data = orjson.loads(picks_response.content)
             
             self.budget = picks_data['entry_history']['bank'] / 10
             self.free_transfers = picks_data['entry_history']['event_transfers_cost']
@@ -171,10 +282,54 @@ class FPLRecommender:
                 self._save_cache('my_team', self.current_team)
             
             return self.current_team
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching team data: {e}")
             return None
     
+    def _build_fixture_tables(self):
+        """
+        Build per-team fixture lookups once per data load:
+        next opponent, opponent short name, home/away and upcoming fixtures/difficulty
+        """
+        self._team_name_map = {team['id']: team['short_name'] for team in self.data['teams']}
+        self._team_next_opponent = {}
+        self._opponent_names = {}
+        self._is_home = {}
+        self._team_upcoming_difficulty = {}
+        self._team_upcoming_fixtures = {}
+        
+        for fixture in self.get_fixtures_for_gameweek(self.current_gameweek):
+            self._team_next_opponent[fixture['team_h']] = fixture['team_a']
+            self._team_next_opponent[fixture['team_a']] = fixture['team_h']
+            self._opponent_names[fixture['team_h']] = self._team_name_map[fixture['team_a']]
+            self._opponent_names[fixture['team_a']] = self._team_name_map[fixture['team_h']]
+            self._is_home[fixture['team_h']] = True
+            self._is_home[fixture['team_a']] = False
+        
+        upcoming = sorted(
+            (
+                f for f in self.data.get('fixtures', [])
+                if f['event'] is not None and f['event'] >= self.current_gameweek and not f['finished']
+            ),
+            key=lambda f: (f['event'], f['kickoff_time'] or '')
+        )
+        for fixture in upcoming:
+            self._team_upcoming_difficulty.setdefault(fixture['team_h'], []).append(fixture['team_h_difficulty'])
+            self._team_upcoming_difficulty.setdefault(fixture['team_a'], []).append(fixture['team_a_difficulty'])
+            # Same shape as element-summary fixtures: seen from the team's side
+            self._team_upcoming_fixtures.setdefault(fixture['team_h'], []).append(
+                {**fixture, 'is_home': True, 'difficulty': fixture['team_h_difficulty']}
+            )
+            self._team_upcoming_fixtures.setdefault(fixture['team_a'], []).append(
+                {**fixture, 'is_home': False, 'difficulty': fixture['team_a_difficulty']}
+            )
+        
+        # Mean FDR over the next 5 fixtures, mapped onto players by team
+        self._team_fdr5 = {
+            team: sum(difficulties[:5]) / len(difficulties[:5])
+            for team, difficulties in self._team_upcoming_difficulty.items()
+        }
+    
     def get_fixtures_for_gameweek(self, gameweek: int = None) -> List[Dict]:
         """Get fixtures for a specific gameweek"""
         if gameweek is None:
@@ -187,24 +342,65 @@ class FPLRecommender:
         return [f for f in self.data['fixtures'] if f['event'] == gameweek]
     
     def prepare_players_dataframe(self) -> pd.DataFrame:
-        """Convert API data to pandas DataFrame"""
+        """Convert API data to pandas DataFrame (or load it from the Parquet cache)"""
         if not self.data:
             self.fetch_fpl_data()
         
-        players = self.data['elements']
-        teams = {team['id']: team['name'] for team in self.data['teams']}
+        parquet_path = self._get_cache_path('players_df', 'parquet')
         
-        position_map = {1: 'GK', 2: 'DEF', 3: 'MID', 4: 'FWD'}
+        df = None
+        if 'elements' not in self.data:
+            # Data came from cache: player rows were stored as a materialized DataFrame
+            try:
+                df = pd.read_parquet(parquet_path)
+                print("  ✓ Loaded players_df from cache")
+            except Exception as e:
+                print(f"  ✗ Cache load failed for players_df: {e}")
+                self.fetch_fpl_data(use_cache=False)
+        
+        if df is None:
+            players = self.data['elements']
+            teams = {team['id']: team['name'] for team in self.data['teams']}
+            
+            position_map = {1: 'GK', 2: 'DEF', 3: 'MID', 4: 'FWD'}
+            
+            df = pd.DataFrame(players, columns=NEEDED_COLS)
+            df['element_type'] = df['element_type'].astype('int8')
+            df['team'] = df['team'].astype('int8')
+            df['status'] = df['status'].astype('category')
+            df['position_name'] = df['element_type'].map(position_map)
+            df['team_name'] = df['team'].map(teams)
+            df['full_name'] = df['first_name'] + ' ' + df['second_name']
+            df['web_name_clean'] = df['web_name'].str.strip()
+            df['value'] = df['now_cost'] / 10
+            df['form_numeric'] = pd.to_numeric(df['form'], errors='coerce').astype('float32')
+            df['selected_by_percent_numeric'] = pd.to_numeric(df['selected_by_percent'], errors='coerce').astype('float32')
+            df['ict_index_numeric'] = pd.to_numeric(df['ict_index'], errors='coerce').astype('float32')
+            df['full_name_lower'] = df['full_name'].str.lower()
+            df['web_name_lower'] = df['web_name'].str.lower()
+            
+            if self._use_cache:
+                try:
+                    df.to_parquet(parquet_path)
+                    print("  ✓ Cached players_df")
+                except Exception as e:
+                    print(f"  ✗ Cache save failed for players_df: {e}")
         
-        df = pd.DataFrame(players)
-        df['position_name'] = df['element_type'].map(position_map)
-        df['team_name'] = df['team'].map(teams)
-        df['full_name'] = df['first_name'] + ' ' + df['second_name']
-        df['web_name_clean'] = df['web_name'].str.strip()
-        df['value'] = df['now_cost'] / 10
-        df['form_numeric'] = pd.to_numeric(df['form'], errors='coerce')
-        df['selected_by_percent_numeric'] = pd.to_numeric(df['selected_by_percent'], errors='coerce')
-        df['ict_index_numeric'] = pd.to_numeric(df['ict_index'], errors='coerce')
+        # Index by player id so squad lookups are hash lookups rather than scans
+        df = df.set_index('id', drop=False).rename_axis(None)
+        
+        # Captaincy position multiplier and premium player bonus, fixed per player
+        codes = df['position_name'].map(POSITION_CODES).fillna(-1).astype(int).to_numpy()
+        df['pos_mult'] = np.where(codes >= 0, POSITION_MULT[codes], 1.0)
+        df['premium_bonus'] = np.where(df['value'] >= 10.0, 0.5, 0.0)
+        
+        # Lowercased name -> player id for exact matches (reversed so the first row wins)
+        self._full_lower_idx = dict(zip(df['full_name_lower'][::-1], df.index[::-1]))
+        self._web_lower_idx = dict(zip(df['web_name_lower'][::-1], df.index[::-1]))
+        
+        # Pre-normalized choice lists for fuzzy matching, built once per DataFrame
+        self._name_choices = [utils.default_process(name) for name in df['full_name']]
+        self._web_choices = [utils.default_process(name) for name in df['web_name']]
         
         self.players_df = df
         return df
@@ -218,82 +414,132 @@ class FPLRecommender:
             self.prepare_players_dataframe()
         
         # Try exact match first
-        exact_match = self.players_df[
-            (self.players_df['full_name'].str.lower() == scraped_name.lower()) |
-            (self.players_df['web_name'].str.lower() == scraped_name.lower())
-        ]
+        scraped_lower = scraped_name.lower()
+        idx = self._full_lower_idx.get(scraped_lower)
+        if idx is None:
+            idx = self._web_lower_idx.get(scraped_lower)
+        
+        if idx is not None:
+            return self.players_df.loc[idx]
+        
+        # Fuzzy match on full names and web names (below threshold returns None)
+        query = utils.default_process(scraped_name)
+        best_match_full = process.extractOne(
+            query, self._name_choices, scorer=fuzz.token_sort_ratio,
+            processor=None, score_cutoff=threshold
+        )
+        best_match_web = process.extractOne(
+            query, self._web_choices, scorer=fuzz.token_sort_ratio,
+            processor=None, score_cutoff=threshold
+        )
         
-        if not exact_match.empty:
-            return exact_match.iloc[0]
-        
-        # Fuzzy match on full names
-        player_names = self.players_df['full_name'].tolist()
-        web_names = self.players_df['web_name'].tolist()
-        
-        # Try full name matching
-        best_match_full = process.extractOne(scraped_name, player_names, scorer=fuzz.token_sort_ratio)
-        best_match_web = process.extractOne(scraped_name, web_names, scorer=fuzz.token_sort_ratio)
-        
-        # Pick the best match
-        if best_match_full and best_match_web:
-            if best_match_full[1] >= best_match_web[1] and best_match_full[1] >= threshold:
-                matched_player = self.players_df[self.players_df['full_name'] == best_match_full[0]].iloc[0]
-                return matched_player
-            elif best_match_web[1] >= threshold:
-                matched_player = self.players_df[self.players_df['web_name'] == best_match_web[0]].iloc[0]
-                return matched_player
-        elif best_match_full and best_match_full[1] >= threshold:
-            matched_player = self.players_df[self.players_df['full_name'] == best_match_full[0]].iloc[0]
-            return matched_player
-        elif best_match_web and best_match_web[1] >= threshold:
-            matched_player = self.players_df[self.players_df['web_name'] == best_match_web[0]].iloc[0]
-            return matched_player
+        # Pick the best match (third element is the row position in players_df)
+        if best_match_full and (not best_match_web or best_match_full[1] >= best_match_web[1]):
+            return self.players_df.iloc[best_match_full[2]]
+        elif best_match_web:
+            return self.players_df.iloc[best_match_web[2]]
         
         return None
     
-    def get_player_fixtures(self, player_id: int, num_fixtures: int = 5) -> List[Dict]:
-        """Get upcoming fixtures for a player"""
+    def _fetch_element_summary(self, player_id: int) -> Optional[Dict]:
+        """Fetch a player's element-summary (upcoming fixtures and match history)"""
         try:
-            response = requests.get(f"{self.base_url}element-summary/{player_id}/")
+            response = self._session.get(f"{self.base_url}element-summary/{player_id}/", timeout=10)
             response.raise_for_status()
-            fixtures = response.json()['fixtures'][:num_fixtures]
-            return fixtures
-        except:
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError):
+            return None
+    
+    def _load_element_summaries(self):
+        """Load cached element-summaries, dropping entries fetched too long ago"""
+        cached = self._load_cache('element_summaries') or {}
+        # Each entry carries its own fetch time, since rewriting the file renews its mtime
+        cutoff = time.time() - self.cache_duration_hours * 3600
+        fetched_at = cached.get('fetched_at') or {}
+        self._element_summary_fetched = {pid: ts for pid, ts in fetched_at.items() if ts >= cutoff}
+        self._element_summary_cache = {pid: cached['summaries'][pid] for pid in self._element_summary_fetched}
+    
+    def _get_element_summary(self, player_id: int) -> Optional[Dict]:
+        """Get a player's element-summary, fetching it only if not already cached"""
+        player_id = int(player_id)
+        if player_id not in self._element_summary_cache:
+            summary = self._fetch_element_summary(player_id)
+            if summary is None:
+                return None
+            self._element_summary_cache[player_id] = summary
+            self._element_summary_fetched[player_id] = time.time()
+        return self._element_summary_cache[player_id]
+    
+    def _prefetch_summaries(self, player_ids: List[int], max_workers: int = 16):
+        """Fetch element-summaries for all given players concurrently"""
+        missing = list({int(pid) for pid in player_ids} - self._element_summary_cache.keys())
+        if not missing:
+            return
+        
+        print(f"  Fetching {len(missing)} player summaries...")
+        fetched_at = time.time()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for player_id, summary in zip(missing, executor.map(self._fetch_element_summary, missing)):
+                if summary is not None:
+                    self._element_summary_cache[player_id] = summary
+                    self._element_summary_fetched[player_id] = fetched_at
+        
+        if self._use_cache:
+            self._save_cache('element_summaries', {
+                'fetched_at': self._element_summary_fetched,
+                'summaries': self._element_summary_cache,
+            })
+    
+    def get_player_fixtures(self, player_id: int, num_fixtures: int = 5) -> List[Dict]:
+        """Get upcoming fixtures for a player (from the per-team fixture tables)"""
+        if self.players_df is None:
+            self.prepare_players_dataframe()
+        
+        player_id = int(player_id)
+        if player_id not in self.players_df.index:
             return []
+        
+        team_id = self.players_df.at[player_id, 'team']
+        return self._team_upcoming_fixtures.get(team_id, [])[:num_fixtures]
     
     def get_player_history_vs_team(self, player_id: int, opponent_team: int) -> Dict:
-        """Get player's historical performance against a specific opponent"""
+        """Get player's historical performance against a specific opponent (memoized)"""
+        key = (int(player_id), opponent_team)
+        if key in self._history_memo:
+            return self._history_memo[key]
+        
         try:
-            response = requests.get(f"{self.base_url}element-summary/{player_id}/")
-            response.raise_for_status()
-            history = response.json()['history']
-            
-            vs_opponent = [h for h in history if h['opponent_team'] == opponent_team]
-            
-            if not vs_opponent:
-                return {'matches': 0, 'avg_points': 0}
-            
+            history = self._get_element_summary(player_id)['history']
+        except:
+            return {'matches': 0, 'avg_points': 0}
+        
+        vs_opponent = [h for h in history if h['opponent_team'] == opponent_team]
+        
+        if not vs_opponent:
+            result = {'matches': 0, 'avg_points': 0}
+        else:
             total_points = sum(match['total_points'] for match in vs_opponent)
-            avg_points = total_points / len(vs_opponent)
-            
-            return {
+            result = {
                 'matches': len(vs_opponent),
                 'total_points': total_points,
-                'avg_points': avg_points
+                'avg_points': total_points / len(vs_opponent)
             }
-        except:
-            return {'matches': 0, 'avg_points': 0}
+        
+        self._history_memo[key] = result
+        return result
     
-    def calculate_fixture_difficulty_score(self, player_id: int, num_fixtures: int = 5) -> float:
-        """Calculate fixture difficulty score for upcoming fixtures"""
-        fixtures = self.get_player_fixtures(player_id, num_fixtures)
+    def calculate_fixture_difficulty_score(self, team_id: int, num_fixtures: int = 5) -> float:
+        """Calculate fixture difficulty score for a team's upcoming fixtures"""
+        # Default path: precomputed next-5 FDR table
+        if num_fixtures == 5:
+            return self._team_fdr5.get(team_id, 3.0)
         
-        if not fixtures:
+        difficulties = self._team_upcoming_difficulty.get(team_id, [])[:num_fixtures]
+        
+        if not difficulties:
             return 3.0
         
-        total_difficulty = sum(fixture['difficulty'] for fixture in fixtures)
-        avg_difficulty = total_difficulty / len(fixtures)
-        return avg_difficulty
+        return sum(difficulties) / len(difficulties)
     
     def integrate_web_data(self, player_row: pd.Series) -> float:
         """
@@ -303,89 +549,122 @@ class FPLRecommender:
         if not self.use_web_data or not self.web_aggregator:
             return 5.0  # Neutral score
         
-        player_name = player_row['full_name']
-        
-        # Get consensus
-        consensus = self.web_aggregator.get_player_consensus_score(player_name)
-        injury_status = self.web_aggregator.get_injury_status(player_name)
-        expected_start = self.web_aggregator.is_expected_to_start(player_name)
+        return float(self._web_scores([player_row['full_name']])[0])
+    
+    def _get_web_snapshot(self, player_names) -> Dict[str, Dict]:
+        """Bulk web data for the given players, fetched once per player per aggregator"""
+        missing = [name for name in dict.fromkeys(player_names) if name not in self._web_snapshot]
+        if missing:
+            self._web_snapshot.update(self.web_aggregator.bulk_consensus(missing))
+        return self._web_snapshot
+    
+    def _web_columns(self, player_names) -> Dict[str, np.ndarray]:
+        """Web snapshot fields for a sequence of player names as parallel arrays"""
+        player_names = list(player_names)
+        snapshot = self._get_web_snapshot(player_names)
+        entries = [snapshot[name] for name in player_names]
+        n = len(entries)
+        
+        return {
+            'consensus_score': np.fromiter((e['consensus_score'] for e in entries), dtype=np.float32, count=n),
+            'mention_count': np.fromiter((e['mention_count'] for e in entries), dtype=np.int32, count=n),
+            'captain_mentions': np.fromiter((e['captain_mentions'] for e in entries), dtype=np.int32, count=n),
+            'expected_start': np.fromiter((e['expected_start'] for e in entries), dtype=bool, count=n),
+            'injury_status': np.array([e['injury_status'] for e in entries], dtype=object)
+        }
+    
+    def _web_scores(self, player_names) -> np.ndarray:
+        """Web consensus scores (0-10) for a sequence of player names"""
+        web = self._web_columns(player_names)
         
         # Base web score from consensus (0-10 scale)
-        web_score = consensus['consensus_score']
+        web_score = web['consensus_score']
+        mention_count = web['mention_count']
+        expected_start = web['expected_start']
+        injury_status = web['injury_status']
         
-        # Apply injury penalties
-        if injury_status == 'out':
-            web_score = 0.0  # Don't recommend injured players
-        elif injury_status == 'doubtful':
-            web_score *= 0.5  # Heavy penalty for doubts
-        elif injury_status == 'suspended':
-            web_score = 0.0  # Don't recommend suspended players
+        # Apply injury penalties: don't recommend injured or suspended players,
+        # heavy penalty for doubts
+        unavailable = (injury_status == 'out') | (injury_status == 'suspended')
+        web_score = np.where(unavailable, 0.0, web_score)
+        web_score = np.where(injury_status == 'doubtful', web_score * 0.5, web_score)
         
         # Bonus for expected starters
-        if expected_start and injury_status not in ['out', 'suspended']:
-            web_score += 1.5
+        web_score += np.where(expected_start & ~unavailable, 1.5, 0.0)
         
         # Boost for high mention count
-        if consensus['mention_count'] >= 3:
-            web_score += 1.0
+        web_score += np.where(mention_count >= 3, 1.0, 0.0)
         
-        return max(0, min(10, web_score))  # Clamp to 0-10
+        return np.clip(web_score, 0, 10)  # Clamp to 0-10
     
     def calculate_player_score(self, player_row: pd.Series, next_opponent: Optional[int] = None) -> float:
         """
         Calculate comprehensive player score
         Weights adjusted to include web data
         """
-        player_id = player_row['id']
-        
+        player_df = player_row.to_frame().T.infer_objects()
+        player_df['next_opponent'] = next_opponent
+        return float(self.calculate_player_scores(player_df).iloc[0])
+    
+    def _historical_scores(self, players: pd.DataFrame) -> np.ndarray:
+        """
+        Historical score (0-10) vs each player's 'next_opponent' (if present)
+        Read from the prefetched element-summaries
+        """
+        opponents = players['next_opponent'] if 'next_opponent' in players else [None] * len(players)
+        return np.fromiter(
+            (
+                min(self.get_player_history_vs_team(player_id, opponent)['avg_points'] * 1.5, 10)
+                if opponent else 0
+                for player_id, opponent in zip(players['id'], opponents)
+            ),
+            dtype=np.float32,
+            count=len(players)
+        )
+    
+    def calculate_player_scores(self, players: pd.DataFrame) -> pd.Series:
+        """
+        Calculate comprehensive player scores for a whole DataFrame at once
+        Uses the 'next_opponent' column (if present) for historical performance
+        """
+        # Pass 1: per-component scores as arrays
         # Form score (0-10 scale)
-        form_score = float(player_row['form_numeric']) if player_row['form_numeric'] > 0 else 0
+        form = players['form_numeric'].to_numpy(dtype=np.float32)
+        form_arr = np.where(form > 0, form, 0)
         
         # Fixture difficulty (invert so easier = higher score)
-        fixture_diff = self.calculate_fixture_difficulty_score(player_id, num_fixtures=5)
-        fixture_score = (6 - fixture_diff) / 5 * 10
+        fixture_diff = players['team'].map(self._team_fdr5).fillna(3.0).to_numpy(dtype=np.float32)
+        fixture_arr = (6 - fixture_diff) / 5 * 10
         
         # Historical performance vs next opponent
-        historical_score = 0
-        if next_opponent:
-            history = self.get_player_history_vs_team(player_id, next_opponent)
-            historical_score = min(history['avg_points'] * 1.5, 10)
+        historical_arr = self._historical_scores(players)
         
         # Overall points (normalize)
-        total_points = player_row['total_points']
-        points_score = min(total_points / 20, 10)
+        points_arr = np.minimum(players['total_points'].to_numpy(dtype=np.float32) / 20, 10)
         
         # ICT Index (normalize)
-        ict_score = min(player_row['ict_index_numeric'] / 20, 10) if player_row['ict_index_numeric'] > 0 else 0
+        ict = players['ict_index_numeric'].to_numpy(dtype=np.float32)
+        ict_arr = np.where(ict > 0, np.minimum(ict / 20, 10), 0)
         
         # Web consensus score
-        web_score = self.integrate_web_data(player_row)
-        
-        # Weighted average with web data
-        if self.use_web_data and self.web_aggregator:
-            weighted_score = (
-                form_score * 0.25 +
-                fixture_score * 0.20 +
-                historical_score * 0.15 +
-                points_score * 0.12 +
-                ict_score * 0.08 +
-                web_score * 0.20  # Web consensus
-            )
+        use_web = self.use_web_data and self.web_aggregator
+        if use_web:
+            web_arr = self._web_scores(players['full_name']).astype(np.float32)
         else:
-            # Without web data, redistribute weights
-            weighted_score = (
-                form_score * 0.30 +
-                fixture_score * 0.25 +
-                historical_score * 0.20 +
-                points_score * 0.15 +
-                ict_score * 0.10
-            )
+            web_arr = np.zeros(len(players), dtype=np.float32)
+        
+        # Pass 2: one weighted sum over the (N, 6) component matrix
+        components = np.stack(
+            [form_arr, fixture_arr, historical_arr, points_arr, ict_arr, web_arr], axis=1
+        ).astype(np.float32)
+        weights = W_WITH_WEB if use_web else W_NO_WEB
         
-        return weighted_score
+        return pd.Series(components @ weights, index=players.index, dtype=float)
     
     def load_web_data(self, aggregator):
         """Load web scraper aggregator"""
         self.web_aggregator = aggregator
+        self._web_snapshot = {}
         print("  ✓ Web data integrated")
     
     def get_current_squad_df(self) -> pd.DataFrame:
@@ -396,8 +675,9 @@ class FPLRecommender:
         if self.players_df is None:
             self.prepare_players_dataframe()
         
-        squad_ids = self.current_team['squad_ids']
-        squad_df = self.players_df[self.players_df['id'].isin(squad_ids)].copy()
+        # Ids missing from players_df (e.g. a stale cache) are skipped, not a KeyError
+        squad_ids = self.players_df.index.intersection(self.current_team['squad_ids'])
+        squad_df = self.players_df.loc[squad_ids, SCORING_COLS].copy()
         
         return squad_df
     
@@ -416,101 +696,102 @@ class FPLRecommender:
         
         current_squad_df = self.get_current_squad_df()
         
-        # Get next opponent for each team
-        fixtures = self.get_fixtures_for_gameweek(self.current_gameweek)
-        team_next_opponent = {}
-        for fixture in fixtures:
-            team_next_opponent[fixture['team_h']] = fixture['team_a']
-            team_next_opponent[fixture['team_a']] = fixture['team_h']
-        
         # Calculate scores for current squad
-        current_squad_df['next_opponent'] = current_squad_df['team'].map(team_next_opponent)
-        current_squad_df['player_score'] = current_squad_df.apply(
-            lambda row: self.calculate_player_score(row, row['next_opponent']),
-            axis=1
-        )
+        self._prefetch_summaries(current_squad_df['id'].tolist())
+        current_squad_df['next_opponent'] = current_squad_df['team'].map(self._team_next_opponent)
+        current_squad_df['player_score'] = self.calculate_player_scores(current_squad_df)
         
         # Filter potential targets
-        available_players = self.players_df[
-            (~self.players_df['id'].isin(self.current_team['squad_ids'])) &
-            (self.players_df['status'] == 'a')
-        ].copy()
-        
+        # (single filtered projection; drop() returns a new frame, so no extra copy)
+        available_mask = self.players_df['status'] == 'a'
         if position_filter:
-            available_players = available_players[available_players['position_name'] == position_filter]
+            available_mask &= self.players_df['position_name'] == position_filter
+        available_players = self.players_df.loc[available_mask, SCORING_COLS].drop(
+            index=self.current_team['squad_ids'], errors='ignore'
+        )
         
         # Calculate scores for available players
-        available_players['next_opponent'] = available_players['team'].map(team_next_opponent)
-        available_players['player_score'] = available_players.apply(
-            lambda row: self.calculate_player_score(row, row['next_opponent']),
-            axis=1
-        )
+        self._prefetch_summaries(available_players['id'].tolist())
+        available_players['next_opponent'] = available_players['team'].map(self._team_next_opponent)
+        available_players['player_score'] = self.calculate_player_scores(available_players)
         
         # Find best transfer options
-        transfer_suggestions = []
+        candidates = []
+        
+        # Squad composition doesn't change while searching
+        team_counts = current_squad_df['team'].value_counts().to_dict()
         
         for pos in ['GK', 'DEF', 'MID', 'FWD']:
             if position_filter and pos != position_filter:
                 continue
             
-            pos_current = current_squad_df[current_squad_df['position_name'] == pos].copy()
-            pos_available = available_players[available_players['position_name'] == pos].copy()
+            pos_current = current_squad_df[current_squad_df['position_name'] == pos]
+            pos_available = available_players[available_players['position_name'] == pos]
             
             pos_current = pos_current.sort_values('player_score', ascending=True)
+            # Sorted once per position so candidate columns are in score order
+            pos_available = pos_available.sort_values('player_score', ascending=False)
             
-            for _, out_player in pos_current.iterrows():
-                selling_price = out_player['now_cost'] / 10
-                available_budget = self.budget + selling_price
-                
-                affordable = pos_available[pos_available['value'] <= available_budget].copy()
-                
-                if affordable.empty:
-                    continue
-                
-                affordable = affordable.sort_values('player_score', ascending=False)
-                
-                team_counts = current_squad_df['team'].value_counts()
-                
-                for _, in_player in affordable.head(10).iterrows():
-                    if in_player['team'] != out_player['team']:
-                        current_team_count = team_counts.get(in_player['team'], 0)
-                        if current_team_count >= 3:
-                            continue
-                    
-                    score_improvement = in_player['player_score'] - out_player['player_score']
-                    
-                    if score_improvement > 0.5:
-                        # Get web insights
-                        web_mentions = 0
-                        web_sentiment = 'neutral'
-                        if self.web_aggregator:
-                            consensus = self.web_aggregator.get_player_consensus_score(in_player['full_name'])
-                            web_mentions = consensus['mention_count']
-                            web_sentiment = consensus['sentiment']
-                        
-                        transfer_suggestions.append({
-                            'out_player': out_player['full_name'],
-                            'out_player_id': out_player['id'],
-                            'out_team': out_player['team_name'],
-                            'out_price': out_player['value'],
-                            'out_score': out_player['player_score'],
-                            'out_form': out_player['form_numeric'],
-                            'in_player': in_player['full_name'],
-                            'in_player_id': in_player['id'],
-                            'in_team': in_player['team_name'],
-                            'in_price': in_player['value'],
-                            'in_score': in_player['player_score'],
-                            'in_form': in_player['form_numeric'],
-                            'position': pos,
-                            'improvement': score_improvement,
-                            'cost_diff': in_player['value'] - out_player['value'],
-                            'web_mentions': web_mentions,
-                            'web_sentiment': web_sentiment
-                        })
-        
-        transfer_suggestions.sort(key=lambda x: x['improvement'], reverse=True)
-        
-        return transfer_suggestions[:num_transfers * 5]
+            # Score every (out, in) pair at once: rows are outgoing players,
+            # columns are candidates in descending score order
+            out_scores = pos_current['player_score'].to_numpy()
+            out_budgets = self.budget + pos_current['now_cost'].to_numpy() / 10
+            out_teams = pos_current['team'].to_numpy()
+            in_scores = pos_available['player_score'].to_numpy()
+            in_values = pos_available['value'].to_numpy()
+            in_teams = pos_available['team'].to_numpy()
+            
+            # Top 10 affordable candidates for each outgoing player
+            affordable = in_values[None, :] <= out_budgets[:, None]
+            top_affordable = affordable & (np.cumsum(affordable, axis=1) <= 10)
+            
+            # Max 3 per club (unless replacing a player from the same club)
+            club_full = np.array([team_counts.get(team, 0) >= 3 for team in in_teams], dtype=bool)
+            team_ok = (in_teams[None, :] == out_teams[:, None]) | ~club_full[None, :]
+            
+            improvement = in_scores[None, :] - out_scores[:, None]
+            rows, cols = np.nonzero(top_affordable & team_ok & (improvement > 0.5))
+            
+            out_players = pos_current.iloc[rows].itertuples(index=False)
+            in_players = pos_available.iloc[cols].itertuples(index=False)
+            
+            # Keep lightweight (improvement, out, in, position) tuples; dicts are built
+            # only for the suggestions that are actually returned
+            candidates.extend(zip(improvement[rows, cols].tolist(), out_players, in_players, repeat(pos)))
+        
+        transfer_suggestions = []
+        for score_improvement, out_player, in_player, pos in heapq.nlargest(
+            num_transfers * 5, candidates, key=itemgetter(0)
+        ):
+            # Get web insights
+            web_mentions = 0
+            web_sentiment = 'neutral'
+            if self.web_aggregator:
+                consensus = self._get_web_snapshot([in_player.full_name])[in_player.full_name]
+                web_mentions = consensus['mention_count']
+                web_sentiment = consensus['sentiment']
+            
+            transfer_suggestions.append({
+                'out_player': out_player.full_name,
+                'out_player_id': out_player.id,
+                'out_team': out_player.team_name,
+                'out_price': out_player.value,
+                'out_score': out_player.player_score,
+                'out_form': out_player.form_numeric,
+                'in_player': in_player.full_name,
+                'in_player_id': in_player.id,
+                'in_team': in_player.team_name,
+                'in_price': in_player.value,
+                'in_score': in_player.player_score,
+                'in_form': in_player.form_numeric,
+                'position': pos,
+                'improvement': score_improvement,
+                'cost_diff': in_player.value - out_player.value,
+                'web_mentions': web_mentions,
+                'web_sentiment': web_sentiment
+            })
+        
+        return transfer_suggestions
     
     def display_transfer_suggestions(self, suggestions: List[Dict]):
         """Display transfer suggestions in a readable format"""
@@ -555,22 +836,12 @@ class FPLRecommender:
         print("="*120)
         print(f"Budget in Bank: £{self.budget:.1f}m | Gameweek: {self.current_gameweek}")
         
-        fixtures = [f for f in self.data['fixtures'] if f['event'] == self.current_gameweek]
-        team_next_opponent = {}
-        opponent_names = {}
-        for fixture in fixtures:
-            team_next_opponent[fixture['team_h']] = fixture['team_a']
-            team_next_opponent[fixture['team_a']] = fixture['team_h']
-            teams_dict = {team['id']: team['short_name'] for team in self.data['teams']}
-            opponent_names[fixture['team_h']] = teams_dict[fixture['team_a']]
-            opponent_names[fixture['team_a']] = teams_dict[fixture['team_h']]
-        
-        current_squad_df['next_opponent'] = current_squad_df['team'].map(team_next_opponent)
-        current_squad_df['opponent_name'] = current_squad_df['team'].map(opponent_names)
-        current_squad_df['player_score'] = current_squad_df.apply(
-            lambda row: self.calculate_player_score(row, row['next_opponent']),
-            axis=1
-        )
+        self._prefetch_summaries(current_squad_df['id'].tolist())
+        current_squad_df['next_opponent'] = current_squad_df['team'].map(self._team_next_opponent)
+        current_squad_df['opponent_name'] = current_squad_df['team'].map(self._opponent_names)
+        current_squad_df['player_score'] = self.calculate_player_scores(current_squad_df)
+        
+        web_snapshot = self._get_web_snapshot(current_squad_df['full_name']) if self.web_aggregator else {}
         
         print("\n" + "-"*120)
         
@@ -579,17 +850,17 @@ class FPLRecommender:
                 'player_score', ascending=False
             )
             print(f"\n{pos}:")
-            for _, player in pos_players.iterrows():
-                fixture_diff = self.calculate_fixture_difficulty_score(player['id'], 5)
+            for player in pos_players.itertuples(index=False):
+                fixture_diff = self.calculate_fixture_difficulty_score(player.team)
                 web_info = ""
                 if self.web_aggregator:
-                    consensus = self.web_aggregator.get_player_consensus_score(player['full_name'])
+                    consensus = web_snapshot[player.full_name]
                     if consensus['mention_count'] > 0:
                         web_info = f" | Web: {consensus['sentiment'][:3].upper()}({consensus['mention_count']})"
                 
-                print(f"  {player['full_name']:25s} ({player['team_name']:12s}) "
-                      f"£{player['value']:4.1f}m | Score: {player['player_score']:4.1f} | "
-                      f"Form: {player['form_numeric']:4.1f} | Next: vs {player['opponent_name']:3s} | "
+                print(f"  {player.full_name:25s} ({player.team_name:12s}) "
+                      f"£{player.value:4.1f}m | Score: {player.player_score:4.1f} | "
+                      f"Form: {player.form_numeric:4.1f} | Next: vs {player.opponent_name:3s} | "
                       f"FDR(5): {fixture_diff:.1f}{web_info}")
         
         print("\n" + "="*120)
@@ -623,192 +894,154 @@ class FPLRecommender:
         
         current_squad_df = self.get_current_squad_df()
         
-        # Get next opponent for each team
-        fixtures = self.get_fixtures_for_gameweek(self.current_gameweek)
-        opponent_names = {}
-        is_home = {}
-        team_next_opponent = {}
-        
-        for fixture in fixtures:
-            team_next_opponent[fixture['team_h']] = fixture['team_a']
-            team_next_opponent[fixture['team_a']] = fixture['team_h']
-            teams_dict = {team['id']: team['short_name'] for team in self.data['teams']}
-            opponent_names[fixture['team_h']] = teams_dict[fixture['team_a']]
-            opponent_names[fixture['team_a']] = teams_dict[fixture['team_h']]
-            is_home[fixture['team_h']] = True
-            is_home[fixture['team_a']] = False
-        
-        current_squad_df['next_opponent'] = current_squad_df['team'].map(team_next_opponent)
-        current_squad_df['opponent_name'] = current_squad_df['team'].map(opponent_names)
-        current_squad_df['is_home'] = current_squad_df['team'].map(is_home)
-        
-        captain_candidates = []
-        
-        for _, player in current_squad_df.iterrows():
-            player_id = player['id']
-            next_opponent = player['next_opponent']
-            
-            # 1. Next fixture difficulty (40% weight)
-            next_fixture = self.get_player_fixtures(player_id, num_fixtures=1)
-            if next_fixture:
-                fixture_difficulty = next_fixture[0]['difficulty']
-                # Invert: easier fixture = higher score
-                fixture_score = (6 - fixture_difficulty) / 5 * 10
-            else:
-                fixture_score = 5.0  # Neutral
-            
-            # 2. Current form (25% weight)
-            form_score = float(player['form_numeric']) if player['form_numeric'] > 0 else 0
-            
-            # 3. Historical vs opponent (20% weight)
-            historical_score = 0
-            if next_opponent:
-                history = self.get_player_history_vs_team(player_id, next_opponent)
-                historical_score = min(history['avg_points'] * 1.5, 10)
-            
-            # 4. Web consensus for captaincy (15% weight)
-            web_captain_score = 5.0  # Neutral default
-            is_web_captain = False
-            
-            if self.web_aggregator:
-                player_name = player['full_name']
-                recs_df = pd.DataFrame(self.web_aggregator.player_data['recommendations'])
-                
-                if not recs_df.empty:
-                    # Check if mentioned as captain pick
-                    captain_recs = recs_df[
-                        (recs_df['player_name'].str.contains(player_name, case=False, na=False)) &
-                        (recs_df['recommendation_type'] == 'captain')
-                    ]
-                    
-                    if not captain_recs.empty:
-                        is_web_captain = True
-                        # High bonus for captain recommendations
-                        captain_mentions = len(captain_recs)
-                        web_captain_score = min(10, 7 + captain_mentions * 1.5)
-                    else:
-                        # Check general consensus
-                        consensus = self.web_aggregator.get_player_consensus_score(player_name)
-                        if consensus['mention_count'] > 0:
-                            web_captain_score = min(consensus['consensus_score'] * 1.2, 10)
-            
-            # Calculate weighted captain score
-            captain_score = (
-                fixture_score * 0.40 +
-                form_score * 0.25 +
-                historical_score * 0.20 +
-                web_captain_score * 0.15
-            )
+        # Only available, in-form players are captain options; the form threshold
+        # is dropped only if no available player meets it (form is thin early on)
+        eligible = current_squad_df['status'] == 'a'
+        in_form = eligible & (current_squad_df['form_numeric'] >= 2.0)
+        if in_form.any():
+            eligible = in_form
+        current_squad_df = current_squad_df[eligible].copy()
+        
+        # Next opponent for each team (precomputed per data load)
+        current_squad_df['next_opponent'] = current_squad_df['team'].map(self._team_next_opponent)
+        current_squad_df['opponent_name'] = current_squad_df['team'].map(self._opponent_names)
+        current_squad_df['is_home'] = current_squad_df['team'].map(self._is_home)
+        
+        self._prefetch_summaries(current_squad_df['id'].tolist())
+        squad = current_squad_df
+        
+        # 1. Next fixture difficulty (40% weight)
+        next_difficulty = squad['team'].map(
+            {team: difficulties[0] for team, difficulties in self._team_upcoming_difficulty.items()}
+        ).to_numpy(dtype=float)
+        has_fixture = ~np.isnan(next_difficulty)
+        # Invert: easier fixture = higher score (neutral without a fixture)
+        fixture_score = np.where(has_fixture, (6 - next_difficulty) / 5 * 10, 5.0)
+        
+        # 2. Current form (25% weight)
+        form = squad['form_numeric'].to_numpy(dtype=float)
+        form_score = np.where(form > 0, form, 0)
+        
+        # 3. Historical vs opponent (20% weight)
+        historical_score = self._historical_scores(squad)
+        
+        # 4. Web consensus for captaincy (15% weight)
+        web_captain_score = np.full(len(squad), 5.0)  # Neutral default
+        is_web_captain = np.zeros(len(squad), dtype=bool)
+        
+        if self.web_aggregator:
+            web = self._web_columns(squad['full_name'])
+            captain_mentions = web['captain_mentions']
+            mention_count = web['mention_count']
+            consensus_score = web['consensus_score']
             
-            # Home advantage bonus
-            if player['is_home']:
-                captain_score += 0.5
-            
-            # Position multiplier (forwards and mids more likely to return)
-            position_multipliers = {'FWD': 1.2, 'MID': 1.1, 'DEF': 0.9, 'GK': 0.5}
-            captain_score *= position_multipliers.get(player['position_name'], 1.0)
-            
-            # Premium player bonus (expensive players more consistent)
-            if player['value'] >= 10.0:
-                captain_score += 0.5
-            
-            # Calculate expected points
-            # Simple model: form * (fixture_ease / 3) * position_multiplier
-            fixture_ease = (6 - fixture_difficulty) / 5 if next_fixture else 0.5
-            expected_points = (
-                float(player['form_numeric']) * 
-                fixture_ease * 
-                position_multipliers.get(player['position_name'], 1.0) * 
-                2  # Captain doubles points
+            # High bonus for captain recommendations, else general consensus
+            is_web_captain = captain_mentions > 0
+            web_captain_score = np.where(
+                is_web_captain,
+                np.minimum(10, 7 + captain_mentions * 1.5),
+                np.where(mention_count > 0, np.minimum(consensus_score * 1.2, 10), web_captain_score)
             )
-            
-            captain_candidates.append({
-                'player_name': player['full_name'],
-                'player_id': player_id,
-                'team': player['team_name'],
-                'position': player['position_name'],
-                'price': player['value'],
-                'captain_score': captain_score,
-                'form': player['form_numeric'],
-                'opponent': player['opponent_name'],
-                'is_home': player['is_home'],
-                'fixture_difficulty': fixture_difficulty if next_fixture else 3,
-                'expected_points': expected_points,
-                'is_web_captain': is_web_captain,
-                'total_points': player['total_points'],
-                'selected_by': player['selected_by_percent_numeric']
-            })
         
-        # Sort by captain score
-        captain_candidates.sort(key=lambda x: x['captain_score'], reverse=True)
+        # Position multiplier (forwards and mids more likely to return)
+        pos_mult = squad['pos_mult'].to_numpy()
+        is_home = squad['is_home'].fillna(False).to_numpy(dtype=bool)
         
-        return captain_candidates[:top_n]
+        # Weighted captain score, plus home advantage bonus, then position multiplier,
+        # plus premium player bonus (expensive players more consistent)
+        components = np.stack(
+            [fixture_score, form_score, historical_score, web_captain_score], axis=1
+        )
+        captain_score = (
+            components @ W_CAPTAIN + np.where(is_home, 0.5, 0.0)
+        ) * pos_mult + squad['premium_bonus'].to_numpy()
+        
+        # Calculate expected points
+        # Simple model: form * fixture_ease * position_multiplier
+        fixture_ease = np.where(has_fixture, (6 - next_difficulty) / 5, 0.5)
+        expected_points = form * fixture_ease * pos_mult * 2  # Captain doubles points
+        
+        # Only the top rows are turned into output records
+        top = squad.assign(
+            captain_score=captain_score,
+            is_home=is_home,
+            fixture_difficulty=np.where(has_fixture, next_difficulty, 3).astype(int),
+            expected_points=expected_points,
+            is_web_captain=is_web_captain
+        ).nlargest(top_n, 'captain_score')
+        
+        return top[list(CAPTAIN_OUT_COLS)].rename(columns=CAPTAIN_OUT_COLS).to_dict('records')
     
-    def suggest_vice_captain(self, captain_choice: str = None) -> Dict:
+    def suggest_vice_captain(self, captain_choice: str = None,
+                             captain_options: List[Dict] = None) -> Dict:
         """
         Suggest vice captain (different from captain, high floor)
         
         Args:
             captain_choice: Name of chosen captain (to exclude)
+            captain_options: Precomputed suggest_captain() output (computed if not given)
             
         Returns:
             Vice captain recommendation
         """
-        captain_options = self.suggest_captain(top_n=15)
+        if captain_options is None:
+            captain_options = self.suggest_captain(top_n=15)
         
         # Filter out captain if specified
-        if captain_choice:
-            captain_options = [
-                opt for opt in captain_options 
-                if opt['player_name'].lower() != captain_choice.lower()
-            ]
+        captain_lc = captain_choice.lower() if captain_choice else None
+        captain_options = [
+            opt for opt in captain_options 
+            if opt['player_name'].lower() != captain_lc
+        ]
+        if not captain_options:
+            return None
         
         # For vice, prioritize consistency (high floor) over ceiling
         # Look for players with:
         # - Good fixtures
         # - Consistent form
         # - Less risky (not rotation prone)
+        options = pd.DataFrame(captain_options)
+        
+        # Penalize very expensive differentials (rotation risk), and
+        # reward consistency (total points vs form ratio)
+        consistency = options['total_points'] / np.maximum(options['form'], 1)
+        options['vice_score'] = (
+            options['captain_score'] * np.where(options['selected_by'] < 5.0, 0.8, 1.0) +
+            np.where(consistency > 15, 0.5, 0.0)
+        )
         
-        for option in captain_options:
-            # Penalize very expensive differentials (rotation risk)
-            if option['selected_by'] < 5.0:
-                option['vice_score'] = option['captain_score'] * 0.8
-            else:
-                option['vice_score'] = option['captain_score']
-            
-            # Reward consistency (total points vs form ratio)
-            consistency = option['total_points'] / max(option['form'], 1)
-            if consistency > 15:  # Consistent performer
-                option['vice_score'] += 0.5
-        
-        captain_options.sort(key=lambda x: x['vice_score'], reverse=True)
-        
-        return captain_options[0] if captain_options else None
+        return options.nlargest(1, 'vice_score').to_dict('records')[0]
     
-    def display_captain_recommendations(self, captain_options: List[Dict]):
-        """Display captain recommendations in a readable format"""
+    def display_captain_recommendations(self, captain_options: List[Dict], num_shown: int = 5):
+        """Display the top captain options; the full list is kept for the vice-captain pick"""
         if not captain_options:
             print("\nNo captain options available!")
             return
         
-        print("\n" + "="*120)
-        print("CAPTAIN RECOMMENDATIONS")
-        print("="*120)
+        shown = captain_options[:num_shown]
         
-        print(f"\nTop {len(captain_options)} Captain Options for Gameweek {self.current_gameweek}:\n")
+        # Build the whole report and write it to stdout in one go
+        rule = "="*120
+        buf = [
+            f"\n{rule}\nCAPTAIN RECOMMENDATIONS\n{rule}\n",
+            f"\nTop {len(shown)} Captain Options for Gameweek {self.current_gameweek}:\n\n"
+        ]
         
-        for i, option in enumerate(captain_options, 1):
+        for i, option in enumerate(shown, 1):
             badge = "⭐ WEB PICK" if option['is_web_captain'] else ""
             home_away = "H" if option['is_home'] else "A"
             
-            print(f"{i}. {option['player_name']:25s} ({option['position']}) {badge}")
-            print(f"   Team: {option['team']:15s} | Price: £{option['price']:.1f}m | "
-                  f"Ownership: {option['selected_by']:.1f}%")
-            print(f"   Fixture: vs {option['opponent']:3s} ({home_away}) | "
-                  f"Difficulty: {option['fixture_difficulty']}/5")
-            print(f"   Form: {option['form']:.1f} | Season Points: {option['total_points']}")
-            print(f"   Captain Score: {option['captain_score']:.2f}/10 | "
-                  f"Expected Points: {option['expected_points']:.1f}")
+            buf.append(
+                f"{i}. {option['player_name']:25s} ({option['position']}) {badge}\n"
+                f"   Team: {option['team']:15s} | Price: £{option['price']:.1f}m | "
+                f"Ownership: {option['selected_by']:.1f}%\n"
+                f"   Fixture: vs {option['opponent']:3s} ({home_away}) | "
+                f"Difficulty: {option['fixture_difficulty']}/5\n"
+                f"   Form: {option['form']:.1f} | Season Points: {option['total_points']}\n"
+                f"   Captain Score: {option['captain_score']:.2f}/10 | "
+                f"Expected Points: {option['expected_points']:.1f}\n"
+            )
             
             # Add reasoning
             reasons = []
@@ -828,31 +1061,34 @@ class FPLRecommender:
                 reasons.append("🔒 Template/Safe")
             
             if reasons:
-                print(f"   Why: {' | '.join(reasons)}")
+                buf.append(f"   Why: {' | '.join(reasons)}\n")
             
-            print()
+            buf.append("\n")
         
-        print("="*120)
+        buf.append(f"{rule}\n")
         
         # Add strategic advice
         top_pick = captain_options[0]
-        print("\n📊 STRATEGIC ADVICE:")
-        print(f"\n🎯 Recommended Captain: {top_pick['player_name']}")
+        buf.append("\n📊 STRATEGIC ADVICE:\n")
+        buf.append(f"\n🎯 Recommended Captain: {top_pick['player_name']}\n")
         
         if top_pick['selected_by'] > 50:
-            print("   Strategy: TEMPLATE PICK - Safe choice, won't gain/lose rank significantly")
+            buf.append("   Strategy: TEMPLATE PICK - Safe choice, won't gain/lose rank significantly\n")
         elif top_pick['selected_by'] < 10:
-            print("   Strategy: DIFFERENTIAL - High risk/reward, can gain rank if successful")
+            buf.append("   Strategy: DIFFERENTIAL - High risk/reward, can gain rank if successful\n")
         else:
-            print("   Strategy: BALANCED - Good risk/reward ratio")
+            buf.append("   Strategy: BALANCED - Good risk/reward ratio\n")
         
         # Vice captain suggestion
-        vice = self.suggest_vice_captain(captain_choice=top_pick['player_name'])
+        vice = self.suggest_vice_captain(
+            captain_choice=top_pick['player_name'], captain_options=captain_options
+        )
         if vice:
-            print(f"\n🔄 Recommended Vice Captain: {vice['player_name']}")
-            print(f"   Reason: Consistent performer with safe floor")
+            buf.append(f"\n🔄 Recommended Vice Captain: {vice['player_name']}\n")
+            buf.append(f"   Reason: Consistent performer with safe floor\n")
         
-        print("\n" + "="*120)
+        buf.append(f"\n{rule}\n")
+        sys.stdout.write(''.join(buf))
         """Display transfer suggestions"""
         if not suggestions:
             print("\nNo significant transfer improvements found!")
@@ -930,10 +1166,13 @@ if __name__ == "__main__":
         # Check for cached web data
         web_cache_path = recommender._get_cache_path('web_data')
         
+        aggregator = None
         if USE_CACHE and recommender._is_cache_valid(web_cache_path):
             print("\nLoading web data from cache...")
             aggregator = recommender._load_cache('web_data')
-        else:
+        
+        # Scrape when there is no usable cache (missing, expired or unreadable)
+        if aggregator is None:
             print("\nScraping fresh data from expert sources...")
             print("This may take 2-3 minutes. Please wait...\n")
             
@@ -1000,8 +1239,9 @@ if __name__ == "__main__":
     print("STEP 5: Captain & Vice Captain Recommendations")
     print(f"{'='*120}")
     print("\nAnalyzing captain options from your squad...")
-    captain_options = recommender.suggest_captain(top_n=5)
-    recommender.display_captain_recommendations(captain_options)
+    # Score a wider pool once: the top 5 are shown, all 15 feed the vice-captain pick
+    captain_options = recommender.suggest_captain(top_n=15)
+    recommender.display_captain_recommendations(captain_options, num_shown=5)
     
     print("\n" + "="*120)
     print("Analysis complete!")
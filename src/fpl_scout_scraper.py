@@ -19,13 +19,27 @@ Usage:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import re
 from typing import Dict, List, Optional
 from datetime import datetime
+import threading
 import time
 
 
+# Patterns used to pull picks out of the Scout Selection article text
+_CAPTAIN_RE = re.compile(r'([\w\s]+)\s+earns?\s+the\s+armband', re.IGNORECASE)
+_VICE_RE = re.compile(r'vice-captaincy?[:\s]+([\w\s]+)', re.IGNORECASE)
+_FORMATION_RE = re.compile(r'(\d-\d-\d)\s+formation')
+# Player Name (Team) £X.Xm - with and without capturing team/price
+# Names are at most three words; bounding the repeat keeps backtracking linear
+_PLAYER_PRICE_RE = re.compile(r'((?:[A-Z][a-z]+\s+){0,2}[A-Z][a-z]+)\s+\(([^)]+)\)\s+£([\d.]+)m')
+_PLAYER_NOPRICE_RE = re.compile(r'((?:[A-Z][a-z]+\s+){0,2}[A-Z][a-z]+)\s+\([^)]+\)\s+£[\d.]+m')
+_GW_RE = re.compile(r'gameweek-(\d+)', re.IGNORECASE)
+_ARTICLE_CLS_RE = re.compile(r'article|content')
+
+
 class BaseFPLScraper:
     """
     Base class for FPL scrapers - minimal version for Scout scraper
@@ -38,14 +52,25 @@ class BaseFPLScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         self.delay = 2  # Seconds between requests
+        
+        # Reuse connections (keep-alive) across page fetches
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
     
     def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """Fetch and parse a webpage"""
         try:
             time.sleep(self.delay)
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            return BeautifulSoup(response.content, 'lxml')
         except requests.exceptions.RequestException as e:
             print(f"Error fetching {url}: {e}")
             return None
@@ -80,13 +105,45 @@ class OfficialPremierLeagueScoutScraper(BaseFPLScraper):
         )
         self.scout_url = scout_url
         self.current_gameweek = None
+        self._cache = {}  # url -> (soup, article, text_content)
+        self._cache_lock = threading.Lock()  # scrape_all calls the scrape_* methods concurrently
         
         # Extract gameweek from URL if possible
         if scout_url:
-            gw_match = re.search(r'gameweek-(\d+)', scout_url.lower())
+            gw_match = _GW_RE.search(scout_url)
             if gw_match:
                 self.current_gameweek = int(gw_match.group(1))
     
+    def __getstate__(self):
+        # Aggregators are cached with their scrapers: locks can't be pickled, and the
+        # parsed soup is too deeply nested to pickle (it is only needed while scraping)
+        state = self.__dict__.copy()
+        state.pop('_cache_lock', None)
+        state.pop('_cache', None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+    
+    def _get_article(self):
+        """Fetch and parse the Scout Selection once, returning (soup, article, text_content)"""
+        # Held across the fetch so concurrent callers wait for one download
+        with self._cache_lock:
+            if self.scout_url in self._cache:
+                return self._cache[self.scout_url]
+            
+            soup = self._fetch_page(self.scout_url)
+            if not soup:
+                return None, None, ''
+            
+            article = soup.find('article') or soup.find('div', class_=_ARTICLE_CLS_RE)
+            text_content = article.get_text() if article else ''
+            
+            self._cache[self.scout_url] = (soup, article, text_content)
+            return self._cache[self.scout_url]
+    
     def scrape_player_recommendations(self) -> List[Dict]:
         """
         Scrape the official Scout Selection team
@@ -108,23 +165,19 @@ class OfficialPremierLeagueScoutScraper(BaseFPLScraper):
             return []
         
         recommendations = []
+        scraped_at = datetime.now().isoformat()  # One timestamp per scrape
         
-        soup = self._fetch_page(self.scout_url)
+        soup, article, text_content = self._get_article()
         if not soup:
             print("    Error: Could not fetch Scout Selection page")
             return recommendations
         
-        # Extract article content
-        article = soup.find('article') or soup.find('div', class_=re.compile(r'article|content'))
-        
         if not article:
             print("    Warning: Could not find article content")
             return recommendations
         
-        text_content = article.get_text()
-        
         # Extract captain
-        captain_match = re.search(r'([\w\s]+)\s+earns?\s+the\s+armband', text_content, re.IGNORECASE)
+        captain_match = _CAPTAIN_RE.search(text_content)
         
         captain_name = None
         vice_captain_name = None
@@ -135,19 +188,22 @@ class OfficialPremierLeagueScoutScraper(BaseFPLScraper):
         
         # Find all player mentions with prices
         # Pattern: Player Name (Team) £X.Xm
-        player_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+\(([^)]+)\)\s+£([\d.]+)m'
-        player_matches = re.findall(player_pattern, text_content)
+        player_matches = _PLAYER_PRICE_RE.findall(text_content)
         
         print(f"    Found {len(player_matches)} players with prices")
         
+        captain_lc = captain_name.lower() if captain_name else None
+        vice_captain_lc = vice_captain_name.lower() if vice_captain_name else None
+        
         for player_name, team_name, price in player_matches:
             player_name = self.normalize_player_name(player_name)
             
             # Determine recommendation type
             rec_type = 'general'
-            if captain_name and captain_name.lower() in player_name.lower():
+            player_lc = player_name.lower()
+            if captain_lc and captain_lc in player_lc:
                 rec_type = 'captain'
-            elif vice_captain_name and vice_captain_name.lower() in player_name.lower():
+            elif vice_captain_lc and vice_captain_lc in player_lc:
                 rec_type = 'captain'  # Vice captain is also strong pick
             
             # All Scout Selection picks are essential (it's the official XI)
@@ -161,13 +217,19 @@ class OfficialPremierLeagueScoutScraper(BaseFPLScraper):
                 'sentiment': 'positive',  # Scout Selection is always positive
                 'article_title': f'Scout Selection GW{self.current_gameweek}' if self.current_gameweek else 'Scout Selection',
                 'article_url': self.scout_url,
-                'scraped_at': datetime.now().isoformat(),
+                'scraped_at': scraped_at,
                 'price': float(price),
                 'team': team_name
             })
         
+        # The priced matches usually cover the full XI already
+        if len(recommendations) >= 11:
+            print(f"    Total recommendations extracted: {len(recommendations)}")
+            return recommendations
+        
         # Also extract player names from paragraph headers
         # Find paragraphs that describe each player
+        seen = {r['player_name'] for r in recommendations}
         paragraphs = article.find_all('p')
         
         for para in paragraphs:
@@ -178,8 +240,8 @@ class OfficialPremierLeagueScoutScraper(BaseFPLScraper):
                 continue
             
             # Look for player names at start of paragraph
-            first_line = para_text.split('\n')[0]
-            potential_name = first_line.split('(')[0].strip()
+            first_line = para_text.partition('\n')[0]
+            potential_name = first_line.partition('(')[0].strip()
             
             # Check if it looks like a player name (2-3 words, capitalized)
             words = potential_name.split()
@@ -187,10 +249,12 @@ class OfficialPremierLeagueScoutScraper(BaseFPLScraper):
                 player_name = self.normalize_player_name(potential_name)
                 
                 # Check if already added
-                if not any(r['player_name'] == player_name for r in recommendations):
+                if player_name not in seen:
+                    seen.add(player_name)
+                    
                     # Determine type from context
                     rec_type = 'essential'
-                    if captain_name and captain_name.lower() in player_name.lower():
+                    if captain_lc and captain_lc in player_name.lower():
                         rec_type = 'captain'
                     
                     recommendations.append({
@@ -200,7 +264,7 @@ class OfficialPremierLeagueScoutScraper(BaseFPLScraper):
                         'sentiment': 'positive',
                         'article_title': f'Scout Selection GW{self.current_gameweek}' if self.current_gameweek else 'Scout Selection',
                         'article_url': self.scout_url,
-                        'scraped_at': datetime.now().isoformat()
+                        'scraped_at': scraped_at
                     })
         
         print(f"    Total recommendations extracted: {len(recommendations)}")
@@ -226,23 +290,16 @@ class OfficialPremierLeagueScoutScraper(BaseFPLScraper):
         if not self.scout_url:
             return {}
         
-        soup = self._fetch_page(self.scout_url)
-        if not soup:
-            return {}
-        
-        article = soup.find('article') or soup.find('div', class_=re.compile(r'article|content'))
+        _, article, text_content = self._get_article()
         if not article:
             return {}
         
-        text_content = article.get_text()
-        
         # Extract formation
-        formation_match = re.search(r'(\d-\d-\d)\s+formation', text_content)
+        formation_match = _FORMATION_RE.search(text_content)
         formation = formation_match.group(1) if formation_match else "Unknown"
         
         # Get all player names
-        player_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+\([^)]+\)\s+£[\d.]+m'
-        player_matches = re.findall(player_pattern, text_content)
+        player_matches = _PLAYER_NOPRICE_RE.findall(text_content)
         
         player_names = [self.normalize_player_name(name) for name in player_matches]
         
@@ -269,23 +326,16 @@ class OfficialPremierLeagueScoutScraper(BaseFPLScraper):
         if not self.scout_url:
             return {}
         
-        soup = self._fetch_page(self.scout_url)
-        if not soup:
-            return {}
-        
-        article = soup.find('article') or soup.find('div', class_=re.compile(r'article|content'))
+        _, article, text_content = self._get_article()
         if not article:
             return {}
         
-        text_content = article.get_text()
-        
         # Extract key information
-        captain_match = re.search(r'([\w\s]+)\s+earns?\s+the\s+armband', text_content, re.IGNORECASE)
-        vice_match = re.search(r'vice-captaincy?[:\s]+([\w\s]+)', text_content, re.IGNORECASE)
-        formation_match = re.search(r'(\d-\d-\d)\s+formation', text_content)
+        captain_match = _CAPTAIN_RE.search(text_content)
+        vice_match = _VICE_RE.search(text_content)
+        formation_match = _FORMATION_RE.search(text_content)
         
-        player_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+\([^)]+\)\s+£[\d.]+m'
-        player_matches = re.findall(player_pattern, text_content)
+        player_matches = _PLAYER_NOPRICE_RE.findall(text_content)
         
         return {
             'gameweek': self.current_gameweek,
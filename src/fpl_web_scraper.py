@@ -1,12 +1,69 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
 from typing import Dict, List, Optional
 import time
+import threading
 import re
 from abc import ABC, abstractmethod
 from datetime import datetime
-import json
+import orjson
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    # Optional: on-disk HTTP cache with conditional revalidation
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+# Shared with the recommender's cache directory so clearing it also clears pages
+HTTP_CACHE_PATH = '.fpl_cache/http_cache'
+
+# Longest back-off (seconds) honoured from Retry-After / X-RateLimit-Reset
+MAX_RATE_LIMIT_WAIT = 60
+
+# Capitalized word runs (likely player names)
+_NAME_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+# Class names of page sections to scan
+_INJURY_SECTION_RE = re.compile(r'news|team|injury')
+_LINEUP_SECTION_RE = re.compile(r'team|lineup')
+_ODDS_RE = re.compile(r'odds|bet|probability')
+
+# Only build the parts of each page that the scrapers read
+_REC_STRAINER = SoupStrainer('article')
+_INJURY_STRAINER = SoupStrainer(['article', 'div'], class_=_INJURY_SECTION_RE)
+_LINEUP_STRAINER = SoupStrainer(['div', 'section'], class_=_LINEUP_SECTION_RE)
+
+INJURY_KEYWORDS = ['injury', 'doubt', 'suspended', 'banned', 'out', 'ruled out',
+                   'fitness', 'unavailable', 'sidelined', 'red card']
+POSITIVE_WORDS = frozenset({'recommend', 'great', 'excellent', 'best', 'strong', 'essential',
+                            'must-have', 'fantastic', 'form', 'fixture'})
+NEGATIVE_WORDS = frozenset({'avoid', 'poor', 'doubt', 'injury', 'rotation', 'risk',
+                            'benched', 'dropped', 'concern'})
+# Lowercase word tokens, keeping hyphenated/apostrophe words (e.g. 'must-have') whole
+_WORD_RE = re.compile(r"[a-z]+(?:['-][a-z]+)*")
+
+
+def _keyword_matcher(keywords) -> re.Pattern:
+    """One-pass matcher for a keyword set: search() finds whether any keyword occurs"""
+    return re.compile('|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
+
+
+_INJURY_KW_RE = _keyword_matcher(INJURY_KEYWORDS)
+
+# Whole-word availability phrases -> status ('out' must not fire on 'about'/'without')
+# (matched against already-lowercased text)
+_STATUS_RE = re.compile(r'\b(ruled out|out|doubt(?:ful|s)?|suspended|banned)\b')
+STATUS_BY_PHRASE = {
+    'ruled out': 'out', 'out': 'out',
+    'doubt': 'doubtful', 'doubts': 'doubtful', 'doubtful': 'doubtful',
+    'suspended': 'suspended', 'banned': 'suspended'
+}
+STATUS_PRIORITY = ['out', 'doubtful', 'suspended']
+
 
 class BaseFPLScraper(ABC):
     """
@@ -15,21 +72,139 @@ class BaseFPLScraper(ABC):
     Provides common functionality and enforces consistent interface
     """
     
-    def __init__(self, base_url: str, source_name: str):
+    def __init__(self, base_url: str, source_name: str, use_http_cache: bool = False):
         self.base_url = base_url
         self.source_name = source_name
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        self.delay = 2  # Seconds between requests (be respectful)
+        self.delay = 0.5  # Minimum seconds between request starts (be respectful)
+        self.max_workers = 4  # Concurrent page fetches per scraper
+        self.max_page_bytes = 4 << 20  # Stop reading a page body after 4 MiB
+        # Opt-in on-disk HTTP cache (off means every page is fetched fresh)
+        self.use_http_cache = use_http_cache and CachedSession is not None
+        
+        # Adaptive rate limit: next time a request may start, pushed back by Retry-After
+        self._next_ok_at = 0.0
+        self._rate_lock = threading.Lock()
+        
+        self.session = self._make_session()
+    
+    def _make_session(self) -> requests.Session:
+        """Pooled keep-alive session with retries on transient errors (HTTP-cached if enabled)"""
+        if self.use_http_cache:
+            # Pages expire after an hour; stale copies are served if the site is unreachable.
+            # Only bodies of known size within max_page_bytes are stored, since the cache
+            # reads the whole body and would bypass the streaming cap in _fetch_page
+            session = CachedSession(
+                HTTP_CACHE_PATH,
+                backend='sqlite',
+                expire_after=3600,
+                cache_control=True,
+                stale_if_error=True,
+                allowable_methods=('GET',),
+                filter_fn=self._is_cacheable
+            )
+        else:
+            session = requests.Session()
+        
+        session.headers.update(self.headers)
+        # 429/503 are returned rather than retried, and Retry-After is not slept on here,
+        # so the shared gate in _note_rate_limit is the only thing that backs off
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 504],
+                              raise_on_status=False, respect_retry_after_header=False)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _is_cacheable(self, response: requests.Response) -> bool:
+        """Whether a response is small enough to store in the HTTP cache"""
+        length = response.headers.get('Content-Length', '')
+        return length.isdigit() and int(length) <= self.max_page_bytes
+    
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
+    
+    def __getstate__(self):
+        # Locks and cache-backed sessions can't be pickled (aggregators are cached with their scrapers)
+        state = self.__dict__.copy()
+        state.pop('_rate_lock', None)
+        state.pop('session', None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._rate_lock = threading.Lock()
+        self.session = self._make_session()
+    
+    def _wait_for_slot(self):
+        """Sleep until a request may start, reserving the next slot for this caller"""
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_ok_at)
+            self._next_ok_at = start_at + self.delay
+        
+        if start_at > now:
+            time.sleep(start_at - now)
+    
+    def _note_rate_limit(self, response: requests.Response):
+        """Back off for as long as the host asks when it signals a rate limit"""
+        headers = response.headers
+        retry_after = headers.get('Retry-After', '')
+        reset = headers.get('X-RateLimit-Reset', '')
+        
+        if response.status_code in (429, 503) and retry_after.isdigit():
+            wait = int(retry_after)
+        elif headers.get('X-RateLimit-Remaining') == '0' and reset.isdigit():
+            # Reset is either seconds from now or an epoch timestamp, depending on the host
+            wait = int(reset)
+            if wait > 10**9:
+                wait -= time.time()
+        else:
+            return
+        
+        # Bounded so a bogus header can't stall the scraper indefinitely
+        wait = min(max(wait, 0), MAX_RATE_LIMIT_WAIT)
+        with self._rate_lock:
+            self._next_ok_at = max(self._next_ok_at, time.monotonic() + wait)
+    
+    def _cached_response(self, url: str) -> Optional[requests.Response]:
+        """Return an HTTP-cache hit for url without going to the network, or None"""
+        if not self.use_http_cache:
+            return None
+        # A miss comes back as a synthetic 504 'Not Cached' response, not None
+        response = self.session.get(url, only_if_cached=True)
+        return response if response.ok else None
     
-    def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a webpage"""
+    def _fetch_page(self, url: str, strainer: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """Fetch and parse a webpage (optionally only the parts matched by strainer)"""
         try:
-            time.sleep(self.delay)  # Rate limiting
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            # Rate limiting only applies to requests that actually reach the host
+            response = self._cached_response(url)
+            if response is None:
+                self._wait_for_slot()
+                response = self.session.get(url, timeout=10, stream=True)
+            
+            with response:
+                self._note_rate_limit(response)
+                response.raise_for_status()
+                
+                # Stream the body with a size cap so an oversized page can't balloon memory
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    body.extend(chunk)
+                    if len(body) > self.max_page_bytes:
+                        # Only warn when bytes past the cap were actually dropped
+                        del body[self.max_page_bytes:]
+                        print(f"Warning: {url} truncated at {self.max_page_bytes} bytes")
+                        break
+            
+            return BeautifulSoup(bytes(body), 'lxml', parse_only=strainer)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching {url}: {e}")
             return None
@@ -60,8 +235,15 @@ class BaseFPLScraper(ABC):
         """Extract potential player names from text using patterns"""
         # This is a simple implementation - can be enhanced with NLP
         # Look for capitalized words (likely names)
-        potential_names = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', text)
-        return [self.normalize_player_name(name) for name in potential_names]
+        return [self.normalize_player_name(name) for name in _NAME_RE.findall(text)]
+    
+    def extract_visible_text(self, element) -> str:
+        """Get an element's readable text, without script/style/navigation markup"""
+        for tag in element(['script', 'style', 'nav', 'footer', 'aside']):
+            tag.decompose()
+        
+        # Join fragments with spaces so names split by inline links stay whole
+        return element.get_text(' ')
 
 
 class FantasyFootballScoutScraper(BaseFPLScraper):
@@ -70,10 +252,11 @@ class FantasyFootballScoutScraper(BaseFPLScraper):
     Extracts player recommendations, injury news, expected lineups, and odds
     """
     
-    def __init__(self):
+    def __init__(self, use_http_cache: bool = False):
         super().__init__(
             base_url="https://www.fantasyfootballscout.co.uk",
-            source_name="Fantasy Football Scout"
+            source_name="Fantasy Football Scout",
+            use_http_cache=use_http_cache
         )
         self.recommendations_url = f"{self.base_url}/fantasy-football-tips/"
         self.team_news_url = f"{self.base_url}/team-news/"
@@ -85,15 +268,17 @@ class FantasyFootballScoutScraper(BaseFPLScraper):
         Returns list of recommended players with context
         """
         recommendations = []
+        scraped_at = datetime.now().isoformat()  # One timestamp per scrape
         
         # Try to get latest articles
-        soup = self._fetch_page(self.recommendations_url)
+        soup = self._fetch_page(self.recommendations_url, _REC_STRAINER)
         if not soup:
             return recommendations
         
         # Find article links (adjust selectors based on actual site structure)
         articles = soup.find_all('article', limit=5)  # Get top 5 articles
         
+        article_links = []
         for article in articles:
             try:
                 # Extract article title and link
@@ -111,35 +296,46 @@ class FantasyFootballScoutScraper(BaseFPLScraper):
                 if article_link and not article_link.startswith('http'):
                     article_link = self.base_url + article_link
                 
-                # Fetch article content
                 if article_link:
-                    article_soup = self._fetch_page(article_link)
-                    if article_soup:
-                        # Extract content
-                        content = article_soup.find('article') or article_soup.find('div', class_='entry-content')
+                    article_links.append((article_title, article_link))
+            
+            except Exception as e:
+                print(f"Error processing article: {e}")
+                continue
+        
+        # Fetch article content concurrently (I/O bound; workers bounded to stay polite)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            article_soups = list(executor.map(self._fetch_page, [link for _, link in article_links]))
+        
+        for (article_title, article_link), article_soup in zip(article_links, article_soups):
+            try:
+                if article_soup:
+                    # Extract content
+                    content = article_soup.find('article') or article_soup.find('div', class_='entry-content')
+                    
+                    if content:
+                        text_content = self.extract_visible_text(content)
                         
-                        if content:
-                            text_content = content.get_text()
-                            
-                            # Extract player names (simple approach)
-                            player_names = self.extract_player_names_from_text(text_content)
-                            
-                            # Determine recommendation type from title
-                            rec_type = self._classify_recommendation_type(article_title)
-                            
-                            # Determine sentiment (positive/negative)
-                            sentiment = self._analyze_sentiment(text_content)
-                            
-                            for player_name in player_names:
-                                recommendations.append({
-                                    'source': self.source_name,
-                                    'player_name': player_name,
-                                    'recommendation_type': rec_type,
-                                    'sentiment': sentiment,
-                                    'article_title': article_title,
-                                    'article_url': article_link,
-                                    'scraped_at': datetime.now().isoformat()
-                                })
+                        # Extract player names (simple approach), one record per player per article
+                        name_counts = Counter(self.extract_player_names_from_text(text_content))
+                        
+                        # Determine recommendation type from title
+                        rec_type = self._classify_recommendation_type(article_title)
+                        
+                        # Determine sentiment (positive/negative)
+                        sentiment = self._analyze_sentiment(text_content)
+                        
+                        for player_name, mentions in name_counts.items():
+                            recommendations.append({
+                                'source': self.source_name,
+                                'player_name': player_name,
+                                'recommendation_type': rec_type,
+                                'sentiment': sentiment,
+                                'article_title': article_title,
+                                'article_url': article_link,
+                                'scraped_at': scraped_at,
+                                'mentions_in_article': mentions
+                            })
             
             except Exception as e:
                 print(f"Error processing article: {e}")
@@ -152,42 +348,37 @@ class FantasyFootballScoutScraper(BaseFPLScraper):
         Scrape injury and availability news
         """
         injury_news = []
+        scraped_at = datetime.now().isoformat()  # One timestamp per scrape
         
-        soup = self._fetch_page(self.team_news_url)
+        soup = self._fetch_page(self.team_news_url, _INJURY_STRAINER)
         if not soup:
             return injury_news
         
         # Look for team news sections
-        news_items = soup.find_all(['article', 'div'], class_=re.compile(r'news|team|injury'))
+        news_items = soup.find_all(['article', 'div'], class_=_INJURY_SECTION_RE)
         
         for item in news_items[:20]:  # Limit to recent items
             try:
                 text = item.get_text()
                 
-                # Look for injury keywords
-                injury_keywords = ['injury', 'doubt', 'suspended', 'banned', 'out', 'ruled out', 
-                                 'fitness', 'unavailable', 'sidelined', 'red card']
+                text_lower = text.lower()  # Shared by the keyword and status passes
                 
-                if any(keyword in text.lower() for keyword in injury_keywords):
+                # Look for injury keywords (stops at the first match)
+                if _INJURY_KW_RE.search(text_lower):
                     # Extract player names
                     player_names = self.extract_player_names_from_text(text)
                     
+                    # Determine status (single whole-word pass, most severe status wins)
+                    statuses = {STATUS_BY_PHRASE[m] for m in _STATUS_RE.findall(text_lower)}
+                    status = next((st for st in STATUS_PRIORITY if st in statuses), 'unknown')
+                    
                     for player_name in player_names:
-                        # Determine status
-                        status = 'unknown'
-                        if 'ruled out' in text.lower() or 'out' in text.lower():
-                            status = 'out'
-                        elif 'doubt' in text.lower():
-                            status = 'doubtful'
-                        elif 'suspended' in text.lower() or 'banned' in text.lower():
-                            status = 'suspended'
-                        
                         injury_news.append({
                             'source': self.source_name,
                             'player_name': player_name,
                             'status': status,
                             'news_text': text[:200],  # First 200 chars
-                            'scraped_at': datetime.now().isoformat()
+                            'scraped_at': scraped_at
                         })
             
             except Exception as e:
@@ -203,12 +394,12 @@ class FantasyFootballScoutScraper(BaseFPLScraper):
         """
         lineups = {}
         
-        soup = self._fetch_page(self.lineups_url)
+        soup = self._fetch_page(self.lineups_url, _LINEUP_STRAINER)
         if not soup:
             return lineups
         
         # Look for team sections
-        team_sections = soup.find_all(['div', 'section'], class_=re.compile(r'team|lineup'))
+        team_sections = soup.find_all(['div', 'section'], class_=_LINEUP_SECTION_RE)
         
         for section in team_sections:
             try:
@@ -247,7 +438,7 @@ class FantasyFootballScoutScraper(BaseFPLScraper):
                 return odds_data
             
             # Look for odds-related content
-            odds_sections = soup.find_all(text=re.compile(r'odds|bet|probability'))
+            odds_sections = soup.find_all(text=_ODDS_RE)
             
             # Extract and parse odds data
             # This would need custom logic based on actual structure
@@ -278,15 +469,11 @@ class FantasyFootballScoutScraper(BaseFPLScraper):
     
     def _analyze_sentiment(self, text: str) -> str:
         """Simple sentiment analysis (positive/negative/neutral)"""
-        text_lower = text.lower()
-        
-        positive_words = ['recommend', 'great', 'excellent', 'best', 'strong', 'essential', 
-                         'must-have', 'fantastic', 'form', 'fixture']
-        negative_words = ['avoid', 'poor', 'doubt', 'injury', 'rotation', 'risk', 
-                         'benched', 'dropped', 'concern']
+        tokens = Counter(_WORD_RE.findall(text.lower()))
         
-        pos_count = sum(1 for word in positive_words if word in text_lower)
-        neg_count = sum(1 for word in negative_words if word in text_lower)
+        # Whole-word occurrences only ('form' no longer matches 'formation')
+        pos_count = sum(tokens[word] for word in POSITIVE_WORDS)
+        neg_count = sum(tokens[word] for word in NEGATIVE_WORDS)
         
         if pos_count > neg_count * 1.5:
             return 'positive'
@@ -296,6 +483,32 @@ class FantasyFootballScoutScraper(BaseFPLScraper):
             return 'neutral'
 
 
+# Record fields the aggregator's lookups read (the rest stay in player_data only)
+REC_COLUMNS = ['player_name', 'recommendation_type', 'sentiment']
+INJURY_COLUMNS = ['player_name', 'status']
+
+SENTIMENT_SCORES = {'positive': 1, 'neutral': 0, 'negative': -1}
+
+# Recommendation type weights for the consensus score
+TYPE_WEIGHTS = {
+    'captain': 3.0,
+    'essential': 2.5,
+    'transfer': 2.0,
+    'differential': 1.5,
+    'general': 1.0,
+    'budget': 1.0,
+    'avoid': -2.0
+}
+
+# Scraper method -> (player_data key, label used in progress output)
+SCRAPE_TASKS = [
+    ('scrape_player_recommendations', 'recommendations', 'recommendations'),
+    ('scrape_injury_news', 'injury_news', 'injury updates'),
+    ('scrape_expected_lineups', 'lineups', 'team lineups'),
+    ('scrape_bookies_odds', 'odds', 'odds entries')
+]
+
+
 class ScraperAggregator:
     
     def __init__(self):
@@ -306,6 +519,14 @@ class ScraperAggregator:
             'lineups': {},
             'odds': []
         }
+        
+        # Cached frames and lowercased-name -> row positions indexes over player_data
+        self._recs_df = pd.DataFrame()
+        self._injuries_df = pd.DataFrame()
+        self._rec_index: Dict[str, List[int]] = {}
+        self._injury_index: Dict[str, List[int]] = {}
+        self._lineup_names: set = set()
+        self._indexed_sizes = None
     
     def add_scraper(self, scraper: BaseFPLScraper):
         """Add a scraper to the aggregator"""
@@ -315,60 +536,87 @@ class ScraperAggregator:
         """Run all scrapers and aggregate data"""
         print(f"\nScraping data from {len(self.scrapers)} source(s)...")
         
-        for scraper in self.scrapers:
-            print(f"\nScraping {scraper.source_name}...")
-            
-            # Recommendations
-            print("  - Player recommendations...")
-            try:
-                recs = scraper.scrape_player_recommendations()
-                self.player_data['recommendations'].extend(recs)
-                print(f"    ✓ Found {len(recs)} recommendations")
-            except Exception as e:
-                print(f"    ✗ Error: {e}")
-            
-            # Injury news
-            print("  - Injury news...")
-            try:
-                injuries = scraper.scrape_injury_news()
-                self.player_data['injury_news'].extend(injuries)
-                print(f"    ✓ Found {len(injuries)} injury updates")
-            except Exception as e:
-                print(f"    ✗ Error: {e}")
-            
-            # Expected lineups
-            print("  - Expected lineups...")
-            try:
-                lineups = scraper.scrape_expected_lineups()
-                self.player_data['lineups'].update(lineups)
-                print(f"    ✓ Found {len(lineups)} team lineups")
-            except Exception as e:
-                print(f"    ✗ Error: {e}")
-            
-            # Odds (if available)
-            if hasattr(scraper, 'scrape_bookies_odds'):
-                print("  - Bookmaker odds...")
-                try:
-                    odds = scraper.scrape_bookies_odds()
-                    self.player_data['odds'].extend(odds)
-                    print(f"    ✓ Found {len(odds)} odds entries")
-                except Exception as e:
-                    print(f"    ✗ Error: {e}")
+        # Every (scraper, method) pair is independent and I/O bound, so run them all at once
+        tasks = [
+            (scraper, method, key, label)
+            for scraper in self.scrapers
+            for method, key, label in SCRAPE_TASKS
+            if hasattr(scraper, method)  # Odds are optional
+        ]
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(max(len(tasks), 1), 16)) as executor:
+                futures = {
+                    executor.submit(getattr(scraper, method)): (scraper, key, label)
+                    for scraper, method, key, label in tasks
+                }
+                
+                # Results are merged on this thread, so no locking is needed
+                for future in as_completed(futures):
+                    scraper, key, label = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"  ✗ {scraper.source_name} - {label}: Error: {e}")
+                        continue
+                    
+                    if isinstance(self.player_data[key], dict):
+                        self.player_data[key].update(result)
+                    else:
+                        self.player_data[key].extend(result)
+                    print(f"  ✓ {scraper.source_name} - Found {len(result)} {label}")
+        finally:
+            for scraper in self.scrapers:
+                scraper.close()
         
         self.scraped_at = datetime.now().isoformat()
+        self._refresh_indexes()
         print(f"\nScraping completed at {self.scraped_at}")
     
+    @staticmethod
+    def _build_name_index(records: List[Dict]) -> Dict[str, List[int]]:
+        """Map each distinct lowercased player name to its record positions"""
+        index = {}
+        for i, record in enumerate(records):
+            index.setdefault(record['player_name'].lower(), []).append(i)
+        return index
+    
+    @staticmethod
+    def _match_rows(index: Dict[str, List[int]], player_name: str) -> List[int]:
+        """Positions of records whose name contains player_name (case-insensitive), in record order"""
+        query = player_name.lower()
+        return sorted(i for name, rows in index.items() if query in name for i in rows)
+    
+    def _refresh_indexes(self):
+        """Rebuild cached frames and name indexes if the scraped data has changed"""
+        recs = self.player_data['recommendations']
+        injuries = self.player_data['injury_news']
+        lineups = self.player_data['lineups']
+        sizes = (len(recs), len(injuries), sum(len(players) for players in lineups.values()))
+        
+        # Aggregators pickled before these caches existed won't have the attribute
+        if getattr(self, '_indexed_sizes', None) == sizes:
+            return
+        
+        # Fixed column lists skip pandas' key-union pass over every record dict
+        self._recs_df = pd.DataFrame.from_records(recs, columns=REC_COLUMNS)
+        self._injuries_df = pd.DataFrame.from_records(injuries, columns=INJURY_COLUMNS)
+        self._rec_index = self._build_name_index(recs)
+        self._injury_index = self._build_name_index(injuries)
+        self._lineup_names = {p.lower() for players in lineups.values() for p in players}
+        self._indexed_sizes = sizes
+    
     def get_player_consensus_score(self, player_name: str) -> Dict:
         """
         Calculate consensus score for a player based on all scraped data
         """
-        recs_df = pd.DataFrame(self.player_data['recommendations'])
+        self._refresh_indexes()
         
-        if recs_df.empty:
+        if self._recs_df.empty:
             return {'consensus_score': 0, 'mention_count': 0, 'sentiment': 'neutral'}
         
         # Filter for this player
-        player_recs = recs_df[recs_df['player_name'].str.contains(player_name, case=False, na=False)]
+        player_recs = self._recs_df.iloc[self._match_rows(self._rec_index, player_name)]
         
         if player_recs.empty:
             return {'consensus_score': 0, 'mention_count': 0, 'sentiment': 'neutral'}
@@ -377,26 +625,11 @@ class ScraperAggregator:
         mention_count = len(player_recs)
         
         # Calculate sentiment score
-        sentiment_scores = {'positive': 1, 'neutral': 0, 'negative': -1}
-        avg_sentiment = player_recs['sentiment'].map(sentiment_scores).mean()
-        
-        # Type weights
-        type_weights = {
-            'captain': 3.0,
-            'essential': 2.5,
-            'transfer': 2.0,
-            'differential': 1.5,
-            'general': 1.0,
-            'budget': 1.0,
-            'avoid': -2.0
-        }
+        sentiment = player_recs['sentiment'].map(SENTIMENT_SCORES)
+        avg_sentiment = sentiment.mean()
         
-        weighted_score = 0
-        for _, rec in player_recs.iterrows():
-            rec_type = rec['recommendation_type']
-            weight = type_weights.get(rec_type, 1.0)
-            sentiment_mult = sentiment_scores.get(rec['sentiment'], 0)
-            weighted_score += weight * (sentiment_mult + 1)  # Make positive
+        weights = player_recs['recommendation_type'].map(TYPE_WEIGHTS).fillna(1.0)
+        weighted_score = float((weights * (sentiment.fillna(0) + 1)).sum())  # Make positive
         
         # Normalize
         consensus_score = weighted_score / max(mention_count, 1)
@@ -412,12 +645,12 @@ class ScraperAggregator:
     
     def get_injury_status(self, player_name: str) -> Optional[str]:
         """Get injury status for a player"""
-        injuries_df = pd.DataFrame(self.player_data['injury_news'])
+        self._refresh_indexes()
         
-        if injuries_df.empty:
+        if self._injuries_df.empty:
             return None
         
-        player_injuries = injuries_df[injuries_df['player_name'].str.contains(player_name, case=False, na=False)]
+        player_injuries = self._injuries_df.iloc[self._match_rows(self._injury_index, player_name)]
         
         if player_injuries.empty:
             return None
@@ -427,15 +660,45 @@ class ScraperAggregator:
     
     def is_expected_to_start(self, player_name: str) -> bool:
         """Check if player is in expected lineups"""
-        for team, players in self.player_data['lineups'].items():
-            if any(player_name.lower() in p.lower() for p in players):
-                return True
-        return False
+        self._refresh_indexes()
+        
+        # Exact hit first, then substring over the distinct lineup names
+        query = player_name.lower()
+        return query in self._lineup_names or any(query in name for name in self._lineup_names)
     
+    def bulk_consensus(self, player_names: List[str]) -> Dict[str, Dict]:
+        """
+        Get web data for many players in one call
+        Returns dict of player_name: consensus fields plus injury_status,
+        expected_start and captain_mentions
+        """
+        self._refresh_indexes()
+        is_captain_rec = (
+            (self._recs_df['recommendation_type'] == 'captain').to_numpy()
+            if not self._recs_df.empty else None
+        )
+
+        snapshot = {}
+        for player_name in dict.fromkeys(player_names):
+            consensus = self.get_player_consensus_score(player_name)
+            captain_mentions = (
+                int(is_captain_rec[self._match_rows(self._rec_index, player_name)].sum())
+                if is_captain_rec is not None else 0
+            )
+
+            snapshot[player_name] = {
+                **consensus,
+                'injury_status': self.get_injury_status(player_name),
+                'expected_start': self.is_expected_to_start(player_name),
+                'captain_mentions': captain_mentions
+            }
+
+        return snapshot
+
     def export_to_json(self, filename: str = 'fpl_scraped_data.json'):
         """Export scraped data to JSON"""
-        with open(filename, 'w') as f:
-            json.dump(self.player_data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(self.player_data, option=orjson.OPT_INDENT_2))
         print(f"\nData exported to {filename}")
     
     def get_summary_dataframe(self) -> pd.DataFrame:
@@ -446,11 +709,18 @@ class ScraperAggregator:
         df = pd.DataFrame(self.player_data['recommendations'])
         
         # Aggregate by player
-        summary = df.groupby('player_name').agg({
-            'recommendation_type': lambda x: ', '.join(x.unique()),
-            'sentiment': lambda x: x.mode()[0] if not x.empty else 'neutral',
-            'player_name': 'count'
-        }).rename(columns={'player_name': 'mention_count'})
+        # Distinct recommendation types in order of first appearance
+        rec_types = (
+            df.drop_duplicates(['player_name', 'recommendation_type'])
+            .groupby('player_name')['recommendation_type'].agg(', '.join)
+        )
+        # Most common sentiment (ties go to the alphabetically first, as with mode())
+        sentiment = df.groupby(['player_name', 'sentiment']).size().unstack(fill_value=0).idxmax(axis=1)
+        mention_count = df.groupby('player_name').size()
+        
+        summary = pd.concat(
+            [rec_types, sentiment.rename('sentiment'), mention_count.rename('mention_count')], axis=1
+        )
         
         summary = summary.sort_values('mention_count', ascending=False)
         